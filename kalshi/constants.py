@@ -31,11 +31,25 @@ MAX_CONCURRENT_EVENT_REQUESTS = 5
 # Request timeouts
 REQUEST_TIMEOUT = 10  # seconds
 
+# HTTP connection pool settings (shared keep-alive session)
+HTTP_POOL_CONNECTIONS = 4   # Number of host pools to cache
+HTTP_POOL_MAXSIZE = 16      # Max pooled connections per host (>= concurrent request limits)
+
 # WebSocket settings
 WEBSOCKET_PING_INTERVAL = 20
 WEBSOCKET_PING_TIMEOUT = 10
 MAX_RECONNECT_ATTEMPTS = 10
 RECONNECT_DELAY = 2  # seconds
 
+# WebSocket data message type -> subscription channel that receives it
+WEBSOCKET_MESSAGE_CHANNELS = {
+    'orderbook_snapshot': 'orderbook_delta',
+    'orderbook_delta': 'orderbook_delta',
+    'ticker': 'ticker',
+    'trade': 'trade',
+    'fill': 'fill',
+    'market_position': 'market_positions'
+}
+
 # Portfolio calculation constants
 CENTS_TO_DOLLARS = 100.0
@@ -76,23 +76,19 @@ def enrich_positions(client: KalshiHTTPClient, positions: List[Dict[str, Any]])
             if market and hasattr(market, 'event_ticker') and market.event_ticker:
                 event_tickers.append(market.event_ticker)
                 market_lookup[ticker] = {'market': market, 'event': None}  # Will be filled later
-            elif market:
-                pass  # Market missing event_ticker
         
         # Batch fetch all events
         if event_tickers:
             events_dict = get_events_by_tickers(client, event_tickers)
             
-            # Map events back to markets
+            # Map events back to markets, dropping markets whose event we can't get.
+            # Build a new lookup instead of deleting from the dict being iterated.
+            resolved_lookup = {}
             for ticker, market_info in market_lookup.items():
-                market = market_info['market']
-                if market and hasattr(market, 'event_ticker'):
-                    event = events_dict.get(market.event_ticker)
-                    if event:
-                        market_lookup[ticker]['event'] = event
-                    else:
-                        # Remove this market from lookup since we can't get its event
-                        del market_lookup[ticker]
+                event = events_dict.get(market_info['market'].event_ticker)
+                if event:
+                    resolved_lookup[ticker] = {'market': market_info['market'], 'event': event}
+            market_lookup = resolved_lookup
         
         # Enrich positions with market data
         enriched_positions = []
@@ -5,6 +5,7 @@ import logging
 import base64
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional
 from datetime import datetime, timezone
 from cryptography.hazmat.primitives import serialization, hashes
@@ -12,7 +13,7 @@ from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric import padding
 
 from config import Config, setup_logging
-from .constants import CACHE_TTL, DEFAULT_CACHE_TTL
+from .constants import CACHE_TTL, DEFAULT_CACHE_TTL, HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE
 
 # Configure logging with centralized setup
 setup_logging(level=logging.INFO, include_filename=True)
@@ -31,6 +32,13 @@ class KalshiHTTPClient:
         self._cache = {}
         self._cache_ttl = CACHE_TTL
         
+        # Persistent session so requests reuse pooled keep-alive connections
+        # instead of paying a TCP/TLS handshake on every call
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
     def _load_private_key(self):
         """Load the private key for raw API authentication."""
         if not self.config.KALSHI_PRIVATE_KEY_PATH:
@@ -52,34 +60,37 @@ class KalshiHTTPClient:
         """Generate cache key."""
         return f"{cache_type}:{identifier}" if identifier else cache_type
     
-    def _is_cache_valid(self, cache_key: str, cache_type: str) -> bool:
+    def _is_entry_valid(self, entry) -> bool:
+        """Check if a cache entry exists and has not expired."""
+        return entry is not None and time.time() < entry[0]
+    
+    def _is_cache_valid(self, cache_key: str) -> bool:
         """Check if cached data is still valid."""
-        if cache_key not in self._cache:
-            return False
-        
-        cached_time, _ = self._cache[cache_key]
-        ttl = self._cache_ttl.get(cache_type, DEFAULT_CACHE_TTL)
-        return (time.time() - cached_time) < ttl
+        return self._is_entry_valid(self._cache.get(cache_key))
     
     def get_cached(self, cache_type: str, identifier: str = ""):
         """Get cached data if valid."""
-        cache_key = self._get_cache_key(cache_type, identifier)
-        if self._is_cache_valid(cache_key, cache_type):
-            _, data = self._cache[cache_key]
-            return data
+        entry = self._cache.get(self._get_cache_key(cache_type, identifier))
+        if self._is_entry_valid(entry):
+            return entry[1]
         return None
     
     def set_cache(self, cache_type: str, data: Any, identifier: str = ""):
         """Set cached data."""
         cache_key = self._get_cache_key(cache_type, identifier)
-        self._cache[cache_key] = (time.time(), data)
+        # Store the expiry time so reads only need a single comparison
+        ttl = self._cache_ttl.get(cache_type, DEFAULT_CACHE_TTL)
+        self._cache[cache_key] = (time.time() + ttl, data)
     
     def clear_cache(self, cache_type: Optional[str] = None):
         """Clear cache entries. If cache_type is None, clear all cache."""
         if cache_type is None:
             self._cache.clear()
         else:
-            keys_to_remove = [key for key in self._cache.keys() if key.startswith(f"{cache_type}:")]
+            # Collect matching keys in one pass, then delete; entries cached without
+            # an identifier are stored under the bare cache_type key
+            prefix = f"{cache_type}:"
+            keys_to_remove = [key for key in self._cache if key == cache_type or key.startswith(prefix)]
             for key in keys_to_remove:
                 del self._cache[key]
     
@@ -101,7 +112,7 @@ class KalshiHTTPClient:
             stats['by_type'][cache_type] = stats['by_type'].get(cache_type, 0) + 1
             
             # Check if expired
-            if not self._is_cache_valid(cache_key, cache_type):
+            if not self._is_cache_valid(cache_key):
                 stats['expired_entries'] += 1
         
         return stats
@@ -124,12 +135,13 @@ class KalshiHTTPClient:
     
     def make_authenticated_request(self, method: str, path: str, params: Optional[Dict] = None) -> requests.Response:
         """Make an authenticated request to the Kalshi API using raw HTTP."""
-        if not self.config.KALSHI_API_KEY_ID or not self._private_key:
+        config = self.config
+        if not config.KALSHI_API_KEY_ID or not self._private_key:
             raise Exception("API credentials not properly configured")
         
         # Determine base URL
-        base_url = (self.config.KALSHI_DEMO_HOST if self.config.KALSHI_DEMO_MODE 
-                   else self.config.KALSHI_API_HOST)
+        base_url = (config.KALSHI_DEMO_HOST if config.KALSHI_DEMO_MODE 
+                   else config.KALSHI_API_HOST)
         
         # Create timestamp
         timestamp = str(int(datetime.now().timestamp() * 1000))
@@ -140,7 +152,7 @@ class KalshiHTTPClient:
         
         # Set up headers
         headers = {
-            'KALSHI-ACCESS-KEY': self.config.KALSHI_API_KEY_ID,
+            'KALSHI-ACCESS-KEY': config.KALSHI_API_KEY_ID,
             'KALSHI-ACCESS-SIGNATURE': signature,
             'KALSHI-ACCESS-TIMESTAMP': timestamp,
             'Content-Type': 'application/json'
@@ -148,17 +160,18 @@ class KalshiHTTPClient:
         
         # Make request - base URL already includes /trade-api/v2
         url = base_url.rstrip('/') + path
-        return requests.request(method, url, headers=headers, params=params)
+        return self.session.request(method, url, headers=headers, params=params)
     
     def make_public_request(self, path: str, params: Optional[Dict] = None) -> requests.Response:
         """Make a public (unauthenticated) request to the Kalshi API."""
         # Determine base URL
-        base_url = (self.config.KALSHI_DEMO_HOST if self.config.KALSHI_DEMO_MODE 
-                   else self.config.KALSHI_API_HOST)
+        config = self.config
+        base_url = (config.KALSHI_DEMO_HOST if config.KALSHI_DEMO_MODE 
+                   else config.KALSHI_API_HOST)
         
         # Make request
         url = base_url.rstrip('/') + path
-        return requests.get(url, params=params)
+        return self.session.get(url, params=params)
     
     def health_check(self) -> bool:
         """Check if the API client is working properly."""
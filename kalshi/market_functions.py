@@ -6,14 +6,13 @@ import concurrent.futures
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
 
-import requests
-
 from .http_client import KalshiHTTPClient
 from .shared_utils import (
     create_sdk_client, preprocess_market_data, preprocess_event_data, 
-    is_market_valid, fetch_event_by_ticker, get_base_api_url
+    is_market_valid, fetch_event_by_ticker, get_base_api_url, parse_market_data
 )
 from .models import Market, Event
+from .constants import REQUEST_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +55,7 @@ def get_market_by_ticker(client: KalshiHTTPClient, ticker: str) -> Optional[Mark
     try:
         # Make direct API call
         url = f"{get_base_api_url(client)}/markets/{ticker}"
-        response = requests.get(url)
+        response = client.session.get(url)
         
         if response.status_code != 200:
             logger.error(f"API call failed: {response.status_code} - {response.text}")
@@ -65,11 +64,7 @@ def get_market_by_ticker(client: KalshiHTTPClient, ticker: str) -> Optional[Mark
         data = response.json()
         
         if 'market' in data and data['market']:
-            market_dict = data['market']
-            # Do this to fit the model schema validation
-            if market_dict.get("status") == "finalized":
-                market_dict["status"] = "settled"
-            market = Market.model_validate(market_dict, strict=False)
+            market = parse_market_data(data['market'])
             # Cache the result
             client.set_cache('market', market, ticker)
             return market
@@ -83,11 +78,11 @@ def get_markets_by_tickers(client: KalshiHTTPClient, tickers: List[str]) -> Dict
     if not tickers:
         return {}
     
-    # Check cache first for all tickers
+    # Check cache first for all tickers (deduplicated so each is fetched at most once)
     cached_markets = {}
     uncached_tickers = []
     
-    for ticker in tickers:
+    for ticker in dict.fromkeys(tickers):
         cached_market = client.get_cached('market', ticker)
         if cached_market is not None:
             cached_markets[ticker] = cached_market
@@ -104,15 +99,12 @@ def get_markets_by_tickers(client: KalshiHTTPClient, tickers: List[str]) -> Dict
         def fetch_single_market(ticker):
             try:
                 url = f"{get_base_api_url(client)}/markets/{ticker}"
-                response = requests.get(url, timeout=10)
+                response = client.session.get(url, timeout=REQUEST_TIMEOUT)
                 
                 if response.status_code == 200:
                     data = response.json()
                     if 'market' in data and data['market']:
-                        market_dict = data['market']
-                        if market_dict.get("status") == "finalized":
-                            market_dict["status"] = "settled"
-                        market = Market.model_validate(market_dict, strict=False)
+                        market = parse_market_data(data['market'])
                         # Cache the result
                         client.set_cache('market', market, ticker)
                         return ticker, market
@@ -172,11 +164,11 @@ def get_events_by_tickers(client: KalshiHTTPClient, event_tickers: List[str]) ->
     if not event_tickers:
         return {}
     
-    # Check cache first for all tickers
+    # Check cache first for all tickers (deduplicated so each is fetched at most once)
     cached_events = {}
     uncached_tickers = []
     
-    for ticker in event_tickers:
+    for ticker in dict.fromkeys(event_tickers):
         cached_event = client.get_cached('event', ticker)
         if cached_event is not None:
             cached_events[ticker] = cached_event
@@ -233,7 +225,7 @@ def get_events(client: KalshiHTTPClient, limit: int = 100, status: Optional[str]
             
             # Make direct API call
             url = f"{get_base_api_url(client)}/events"
-            response = requests.get(url, params=params)
+            response = client.session.get(url, params=params)
             
             if response.status_code != 200:
                 logger.error(f"API call failed: {response.status_code} - {response.text}")
@@ -121,6 +121,10 @@ def calculate_filtered_portfolio_metrics(client: KalshiHTTPClient, start_date=No
         enriched_positions = base_metrics['enriched_positions']
         filtered_enriched_positions = []
         
+        # Convert the range bounds to dates once rather than for every position
+        start_date_only = start_date.date() if hasattr(start_date, 'date') else start_date
+        end_date_only = end_date.date() if hasattr(end_date, 'date') else end_date
+        
         for pos in enriched_positions:
             # Check if this position's last update falls within the date range
             position_data = pos.get('position', {})
@@ -133,14 +137,13 @@ def calculate_filtered_portfolio_metrics(client: KalshiHTTPClient, start_date=No
                     pos_datetime = datetime.fromisoformat(last_updated_str)
                     
                     # Check if position falls within date range (inclusive)
+                    pos_date = pos_datetime.date()
                     include_position = True
                     if start_date:
-                        start_date_only = start_date.date() if hasattr(start_date, 'date') else start_date
-                        if pos_datetime.date() < start_date_only:
+                        if pos_date < start_date_only:
                             include_position = False
                     if end_date and include_position:
-                        end_date_only = end_date.date() if hasattr(end_date, 'date') else end_date
-                        if pos_datetime.date() > end_date_only:  # Exclude dates after end_date
+                        if pos_date > end_date_only:  # Exclude dates after end_date
                             include_position = False
                     
                     if include_position:
@@ -202,7 +202,7 @@ class Event(KalshiEvent):
             return []
         
         if not isinstance(v, list):
-            logger.debug(f"Markets field is not a list: {type(v)}, returning empty list")
+            logger.debug("Markets field is not a list: %s, returning empty list", type(v))
             return []
         
         # If markets list is empty or contains no valid data, return empty list
@@ -218,14 +218,14 @@ class Event(KalshiEvent):
                     status = market_data.get('status')
                     valid_statuses = {'initialized', 'active', 'closed', 'settled', 'determined'}
                     if status and status not in valid_statuses:
-                        logger.debug(f"Converting non-standard status '{status}' market {market_data.get('ticker', 'unknown')} to 'closed' in event validation")
+                        logger.debug("Converting non-standard status '%s' market %s to 'closed' in event validation", status, market_data.get('ticker', 'unknown'))
                         market_data['status'] = 'closed'
                 
                 # Use strict=False to be more lenient with validation
                 validated_markets.append(Market.model_validate(market_data, strict=False))
             except Exception as e:
                 market_ticker = market_data.get('ticker', 'unknown') if isinstance(market_data, dict) else 'unknown'
-                logger.debug(f"Skipping invalid market {market_ticker} in event: {e}")
+                logger.debug("Skipping invalid market %s in event: %s", market_ticker, e)
                 continue
         return validated_markets
     
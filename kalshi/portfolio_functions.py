@@ -7,6 +7,7 @@ from datetime import datetime, timezone, timedelta
 
 from .http_client import KalshiHTTPClient
 from .shared_utils import create_sdk_client
+from .market_functions import get_market_by_ticker, get_markets_by_tickers
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +88,7 @@ def get_all_positions(client: KalshiHTTPClient) -> Optional[Dict[str, Any]]:
         
         result = {
             'active_positions': active_positions,  # Only positions with actual holdings
+            'active_positions_by_ticker': {pos['ticker']: pos for pos in active_positions},  # Index for per-ticker lookups
             'all_market_positions': all_market_positions,  # All market positions from API
             'all_event_positions': all_event_positions,    # Event-level position data
             'positions': active_positions,  # Alias for backward compatibility
@@ -240,17 +242,11 @@ def calculate_unrealized_pnl(client: KalshiHTTPClient, ticker: str) -> Optional[
             return None
         
         # Find the position for this ticker
-        position = None
-        for pos in positions_data.get('active_positions', []):
-            if pos.get('ticker') == ticker:
-                position = pos
-                break
-        
+        position = positions_data['active_positions_by_ticker'].get(ticker)
         if not position:
             return None
         
         # Get current market price
-        from .market_functions import get_market_by_ticker
         market = get_market_by_ticker(client, ticker)
         if not market:
             return None
@@ -267,10 +263,11 @@ def calculate_unrealized_pnl(client: KalshiHTTPClient, ticker: str) -> Optional[
         market_exposure_dollars = float(position['market_exposure_dollars'])  # Total cost basis
         realized_pnl_dollars = float(position['realized_pnl_dollars'])  # Already realized P&L
         fees_paid_dollars = float(position['fees_paid_dollars'])  # Fees paid
+        contracts = abs(position_size)  # Number of contracts held on either side
         
         # Calculate cost basis per share
         if position_size != 0:
-            cost_basis_per_share = market_exposure_dollars / abs(position_size)
+            cost_basis_per_share = market_exposure_dollars / contracts
         else:
             cost_basis_per_share = 0
         
@@ -281,13 +278,13 @@ def calculate_unrealized_pnl(client: KalshiHTTPClient, ticker: str) -> Optional[
         elif position_size < 0:
             # Short YES position (or long NO position)
             current_price = 1 - current_price
-            unrealized_pnl = (current_price - cost_basis_per_share) * abs(position_size)
+            unrealized_pnl = (current_price - cost_basis_per_share) * contracts
         else:
             # No position
             unrealized_pnl = 0
         
         # Calculate market value
-        market_value = current_price * abs(position_size)
+        market_value = current_price * contracts
         
         # Calculate unrealized P&L percentage
         if market_exposure_dollars > 0:
@@ -324,6 +321,10 @@ def get_all_unrealized_pnl(client: KalshiHTTPClient) -> Optional[Dict[str, Any]]
         
         active_positions = positions_data.get('active_positions', [])
         
+        # Fetch all markets concurrently up front so the per-position lookups
+        # below are served from cache instead of one blocking request each
+        get_markets_by_tickers(client, [pos['ticker'] for pos in active_positions if pos.get('ticker')])
+        
         unrealized_pnl_data = {}
         total_unrealized_pnl = 0.0
         total_market_value = 0.0
@@ -359,6 +360,10 @@ def filter_market_positions_by_date(market_positions: List[Dict[str, Any]], star
     filtered_positions = []
     excluded_count = 0
     
+    # Convert the range bounds to dates once rather than for every position
+    start_date_only = start_date.date() if hasattr(start_date, 'date') else start_date
+    end_date_only = end_date.date() if hasattr(end_date, 'date') else end_date
+    
     for pos in market_positions:
         try:
             # Parse the timestamp
@@ -372,14 +377,10 @@ def filter_market_positions_by_date(market_positions: List[Dict[str, Any]], star
             # Filter by date range (compare dates, not datetime objects)
             include_position = True
             if start_date:
-                # Convert start_date to date if it's a datetime
-                start_date_only = start_date.date() if hasattr(start_date, 'date') else start_date
                 if pos_date < start_date_only:
                     include_position = False
                     excluded_count += 1
             if end_date and include_position:
-                # Convert end_date to date if it's a datetime
-                end_date_only = end_date.date() if hasattr(end_date, 'date') else end_date
                 if pos_date > end_date_only:
                     include_position = False
                     excluded_count += 1
@@ -4,11 +4,10 @@ Kalshi Shared Utilities - Common functions used across multiple modules.
 import logging
 from typing import Dict, Any, Optional, List
 import kalshi_python
-import requests
 
 from .http_client import KalshiHTTPClient
 from .constants import VALID_MARKET_STATUSES, REQUEST_TIMEOUT
-from .models import Event
+from .models import Market, Event
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +36,7 @@ def preprocess_market_data(data):
         # Handle status field - map non-standard values to valid enum values
         status = cleaned.get('status')
         if status and status not in VALID_MARKET_STATUSES:
-            logger.info(f"Converting non-standard status '{status}' to 'closed' for ticker: {cleaned.get('ticker', 'unknown')}")
+            logger.debug("Converting non-standard status '%s' to 'closed' for ticker: %s", status, cleaned.get('ticker', 'unknown'))
             cleaned['status'] = 'closed'
         
         # Recursively clean nested structures
@@ -50,6 +49,13 @@ def preprocess_market_data(data):
     else:
         return data
 
+def parse_market_data(market_dict: Dict[str, Any]) -> Market:
+    """Validate a raw market payload from the REST API into a Market model."""
+    # Do this to fit the model schema validation
+    if market_dict.get("status") == "finalized":
+        market_dict["status"] = "settled"
+    return Market.model_validate(market_dict, strict=False)
+
 def preprocess_event_data(data, status: Optional[str] = None):
     """Recursively preprocess event data to handle known API inconsistencies."""
     markets = data.get('markets', [])
@@ -81,7 +87,7 @@ def fetch_event_by_ticker(client: KalshiHTTPClient, event_ticker: str) -> Option
     try:
         # Make direct API call to get event
         url = f"{client.config.KALSHI_DEMO_HOST if client.config.KALSHI_DEMO_MODE else client.config.KALSHI_API_HOST}/events/{event_ticker}"
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
+        response = client.session.get(url, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
             data = response.json()
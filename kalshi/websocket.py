@@ -16,6 +16,7 @@ from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric import padding
 
 from config import Config, setup_logging
+from .constants import WEBSOCKET_MESSAGE_CHANNELS
 
 # Configure logging with centralized setup
 setup_logging(level=logging.INFO, include_filename=True)
@@ -116,8 +117,8 @@ class KalshiWebSocketClient:
         try:
             auth_headers = self._get_auth_headers()
             
-            logger.info(f"Connecting to Kalshi WebSocket: {self.ws_url}")
-            logger.info(f"Using headers: {auth_headers}")
+            logger.info("Connecting to Kalshi WebSocket: %s", self.ws_url)
+            logger.info("Using headers: %s", auth_headers)
             
             self.ws = await websockets.connect(
                 self.ws_url,
@@ -134,11 +135,11 @@ class KalshiWebSocketClient:
             asyncio.create_task(self._listen())
             
             # Resubscribe to all previous subscriptions
-            for subscription in self.subscriptions:
-                await self._send_subscription(json.loads(subscription))
+            for message in self.subscriptions:
+                await self._send_subscription(message)
             
         except Exception as e:
-            logger.error(f"Failed to connect to WebSocket: {e}")
+            logger.error("Failed to connect to WebSocket: %s", e)
             raise
     
     async def disconnect(self):
@@ -148,18 +149,17 @@ class KalshiWebSocketClient:
             await self.ws.close()
             logger.info("Disconnected from Kalshi WebSocket")
     
-    async def _send_subscription(self, subscription: Dict[str, Any]):
-        """Send a subscription message."""
+    async def _send_subscription(self, message: str):
+        """Send an already-serialized subscription message."""
         if not self.ws:
             logger.error("WebSocket not connected")
             return
         
         try:
-            message = json.dumps(subscription)
             await self.ws.send(message)
-            logger.debug(f"Sent subscription: {message}")
+            logger.debug("Sent subscription: %s", message)
         except Exception as e:
-            logger.error(f"Failed to send subscription: {e}")
+            logger.error("Failed to send subscription: %s", e)
     
     def subscribe_orderbook_updates(self, market_tickers: List[str], callback: Optional[Callable] = None):
         """Subscribe to orderbook updates for specified markets."""
@@ -173,12 +173,13 @@ class KalshiWebSocketClient:
             }
         }
         
-        self.subscriptions.add(json.dumps(subscription))
+        message = json.dumps(subscription)
+        self.subscriptions.add(message)
         self._register_callback("orderbook_delta", callback)
         
         if self.running and self.ws:
             # Create task and store it to prevent garbage collection
-            task = asyncio.create_task(self._send_subscription(subscription))
+            task = asyncio.create_task(self._send_subscription(message))
             # Don't await here since this is a sync method
     
     def subscribe_market_ticker(self, market_tickers: List[str], callback: Optional[Callable] = None):
@@ -193,12 +194,13 @@ class KalshiWebSocketClient:
             }
         }
         
-        self.subscriptions.add(json.dumps(subscription))
+        message = json.dumps(subscription)
+        self.subscriptions.add(message)
         self._register_callback("ticker", callback)
         
         if self.running and self.ws:
             # Create task and store it to prevent garbage collection
-            task = asyncio.create_task(self._send_subscription(subscription))
+            task = asyncio.create_task(self._send_subscription(message))
             # Don't await here since this is a sync method
     
     def subscribe_public_trades(self, market_tickers: List[str], callback: Optional[Callable] = None):
@@ -213,12 +215,13 @@ class KalshiWebSocketClient:
             }
         }
         
-        self.subscriptions.add(json.dumps(subscription))
+        message = json.dumps(subscription)
+        self.subscriptions.add(message)
         self._register_callback("trades", callback)
         
         if self.running and self.ws:
             # Create task and store it to prevent garbage collection
-            task = asyncio.create_task(self._send_subscription(subscription))
+            task = asyncio.create_task(self._send_subscription(message))
             # Don't await here since this is a sync method
     
     def subscribe_fills(self, callback: Optional[Callable] = None):
@@ -232,12 +235,13 @@ class KalshiWebSocketClient:
             }
         }
         
-        self.subscriptions.add(json.dumps(subscription))
+        message = json.dumps(subscription)
+        self.subscriptions.add(message)
         self._register_callback("fill", callback)
         
         if self.running and self.ws:
             # Create task and store it to prevent garbage collection
-            task = asyncio.create_task(self._send_subscription(subscription))
+            task = asyncio.create_task(self._send_subscription(message))
             # Don't await here since this is a sync method
     
     def subscribe_market_positions(self, callback: Optional[Callable] = None):
@@ -251,12 +255,13 @@ class KalshiWebSocketClient:
             }
         }
         
-        self.subscriptions.add(json.dumps(subscription))
+        message = json.dumps(subscription)
+        self.subscriptions.add(message)
         self._register_callback("market_positions", callback)
         
         if self.running and self.ws:
             # Create task and store it to prevent garbage collection
-            task = asyncio.create_task(self._send_subscription(subscription))
+            task = asyncio.create_task(self._send_subscription(message))
             # Don't await here since this is a sync method
     
     def _register_callback(self, channel: str, callback: Optional[Callable]):
@@ -278,43 +283,31 @@ class KalshiWebSocketClient:
                 msg = data.get("msg", {})
                 channel = msg.get("channel")
                 sid = msg.get("sid")
-                logger.info(f"Subscribed to {channel} with SID {sid}")
+                logger.info("Subscribed to %s with SID %s", channel, sid)
                 if channel:
                     self.subscription_ids[channel] = sid
                     
             elif msg_type == "unsubscribed":
                 # Unsubscription confirmation
                 sid = data.get("sid")
-                logger.info(f"Unsubscribed from SID {sid}")
+                logger.info("Unsubscribed from SID %s", sid)
                 
             elif msg_type == "ok":
                 # Update subscription confirmation
-                logger.info(f"Subscription updated: {data.get('market_tickers', [])}")
+                logger.info("Subscription updated: %s", data.get('market_tickers', []))
                 
             elif msg_type == "error":
                 # Error response
                 error_msg = data.get("msg", {})
-                logger.error(f"WebSocket error: {error_msg}")
+                logger.error("WebSocket error: %s", error_msg)
                 
             else:
                 # This should be actual data messages
-                # Extract channel from the message structure
-                channel = None
+                # Map the message type to its channel with a single table lookup
                 message_type = msg_type
+                channel = WEBSOCKET_MESSAGE_CHANNELS.get(msg_type)
                 
-                # Try to determine channel from message structure based on guide examples
-                if msg_type == "orderbook_snapshot" or msg_type == "orderbook_delta":
-                    channel = "orderbook_delta"
-                elif msg_type == "ticker":
-                    channel = "ticker"
-                elif msg_type == "trade":
-                    channel = "trade"
-                elif msg_type == "fill":
-                    channel = "fill"
-                elif msg_type == "market_position":
-                    channel = "market_positions"
-                
-                logger.debug(f"Received {channel} message: {message_type}")
+                logger.debug("Received %s message: %s", channel, message_type)
                 
                 # Add to message queue for external processing
                 self.message_queue.put({
@@ -333,12 +326,12 @@ class KalshiWebSocketClient:
                             else:
                                 callback(data)
                         except Exception as e:
-                            logger.error(f"Error in callback for {channel}: {e}")
+                            logger.error("Error in callback for %s: %s", channel, e)
             
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse WebSocket message: {e}")
+            logger.error("Failed to parse WebSocket message: %s", e)
         except Exception as e:
-            logger.error(f"Error handling WebSocket message: {e}")
+            logger.error("Error handling WebSocket message: %s", e)
     
     async def _listen(self):
         """Listen for WebSocket messages."""
@@ -366,7 +359,7 @@ class KalshiWebSocketClient:
             self.reconnect_attempts += 1
             delay = self.reconnect_delay * (2 ** (self.reconnect_attempts - 1))  # Exponential backoff
             
-            logger.info(f"Attempting to reconnect in {delay} seconds (attempt {self.reconnect_attempts}/{self.max_reconnect_attempts})")
+            logger.info("Attempting to reconnect in %s seconds (attempt %s/%s)", delay, self.reconnect_attempts, self.max_reconnect_attempts)
             await asyncio.sleep(delay)
             
             try:
@@ -374,7 +367,7 @@ class KalshiWebSocketClient:
                 await self._listen()
                 return  # Successfully reconnected
             except Exception as e:
-                logger.error(f"Reconnection attempt {self.reconnect_attempts} failed: {e}")
+                logger.error("Reconnection attempt %s failed: %s", self.reconnect_attempts, e)
         
         if self.running:
             logger.error("Max reconnection attempts reached. WebSocket will not reconnect.")
@@ -18,7 +18,7 @@ try:
 except ImportError:
     NUMPY_AVAILABLE = False
 
-from kalshi.models import Market, Event, ScreeningResult
+from kalshi.models import Market, Event, ScreeningResult, utc_now
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -280,7 +280,8 @@ Please generate a Python screening function based on the above request. The func
             
             screen_function = safe_locals['screen_markets']
             
-            # Execute screening directly on markets
+            # Execute screening directly on markets, sharing one timestamp across the run
+            screened_at = utc_now()
             results = []
             for market in markets:
                 # Get the event for this market
@@ -297,7 +298,8 @@ Please generate a Python screening function based on the above request. The func
                         market=market,
                         event=event,
                         score=1.0 if passes else 0.0,
-                        reasons=reasons if isinstance(reasons, list) else [str(reasons)]
+                        reasons=reasons if isinstance(reasons, list) else [str(reasons)],
+                        timestamp=screened_at
                     )
                     results.append(result)
                     
@@ -308,7 +310,8 @@ Please generate a Python screening function based on the above request. The func
                         market=market,
                         event=event,
                         score=0.0,
-                        reasons=[f"Screening error: {str(e)}"]
+                        reasons=[f"Screening error: {str(e)}"],
+                        timestamp=screened_at
                     )
                     results.append(failed_result)
             
@@ -318,28 +321,6 @@ Please generate a Python screening function based on the above request. The func
             logger.error(f"Error executing screening function: {e}")
             return []
     
-    def _create_screening_results_from_markets(self, markets: List[Market], events: List[Event]) -> List[ScreeningResult]:
-        """Create ScreeningResult objects from markets and events."""
-        results = []
-        for market in markets:
-            # Find corresponding event
-            event = None
-            for e in events:
-                if any(m.ticker == market.ticker for m in e.markets):
-                    event = e
-                    break
-            
-            # Create a basic screening result (will be re-screened)
-            result = ScreeningResult(
-                market=market,
-                event=event,
-                score=0.0,
-                reasons=[]
-            )
-            results.append(result)
-        
-        return results
-    
     def _execute_screening_on_results(self, code: str, screening_results: List[ScreeningResult]) -> List[ScreeningResult]:
         """Execute screening function on ScreeningResult objects."""
         try:
@@ -358,7 +339,8 @@ Please generate a Python screening function based on the above request. The func
             
             screen_function = safe_locals['screen_markets']
             
-            # Execute screening using existing market-event pairs
+            # Execute screening using existing market-event pairs, sharing one timestamp across the run
+            screened_at = utc_now()
             results = []
             for result in screening_results:
                 market = result.market
@@ -373,7 +355,8 @@ Please generate a Python screening function based on the above request. The func
                         market=market,
                         event=event,
                         score=1.0 if passes else 0.0,
-                        reasons=reasons if isinstance(reasons, list) else [str(reasons)]
+                        reasons=reasons if isinstance(reasons, list) else [str(reasons)],
+                        timestamp=screened_at
                     )
                     results.append(new_result)
                     
@@ -387,7 +370,8 @@ Please generate a Python screening function based on the above request. The func
                         market=market,
                         event=event,
                         score=0.0,
-                        reasons=[f"Screening error: {error_msg}"]
+                        reasons=[f"Screening error: {error_msg}"],
+                        timestamp=screened_at
                     )
                     results.append(failed_result)
             
@@ -401,7 +385,7 @@ Please generate a Python screening function based on the above request. The func
         """
         Safely execute the generated screening function using existing screening results.
         
-        This method is kept for backward compatibility but now delegates to execute_screening_function.
+        This method is kept for backward compatibility and reuses the existing market-event pairs.
         
         Args:
             code: Python function code
@@ -410,7 +394,7 @@ Please generate a Python screening function based on the above request. The func
         Returns:
             List of new screening results
         """
-        return self.execute_screening_function(code, screening_results)
+        return self._execute_screening_on_results(code, screening_results)
     
     def _create_safe_execution_environment(self) -> dict:
         """Create a safe execution environment for generated code."""
@@ -2,6 +2,7 @@
 Market screening logic for identifying profitable trading opportunities.
 """
 import logging
+from operator import attrgetter
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 
@@ -16,11 +17,17 @@ logger = logging.getLogger(__name__)
 class MarketScreener:
     """Screens markets for profitable trading characteristics."""
     
+    __slots__ = (
+        'kalshi_client', 'config', 'screening_criteria',
+        '_min_spread_cents', '_max_spread_cents', '_criteria_empty'
+    )
+    
     def __init__(self, kalshi_client: KalshiAPIClient, config: Config, custom_criteria: Optional[ScreeningCriteria] = None):
         """Initialize the market screener."""
         self.kalshi_client = kalshi_client
         self.config = config
         self.screening_criteria = custom_criteria or self._create_default_criteria()
+        self._refresh_derived_criteria()
         
     def _create_default_criteria(self) -> ScreeningCriteria:
         """Create default screening criteria from config."""
@@ -36,6 +43,18 @@ class MarketScreener:
             categories=None  # No category filtering by default
         )
     
+    def _refresh_derived_criteria(self):
+        """
+        Precompute values derived from the screening criteria.
+        
+        Criteria can be edited in place between runs (the dashboard does this),
+        so this is called at the start of every screening run rather than per market.
+        """
+        criteria = self.screening_criteria
+        self._min_spread_cents = criteria.min_spread_cents or 0
+        self._max_spread_cents = criteria.max_spread_cents or float('inf')
+        self._criteria_empty = self._no_criteria_set()
+    
     def get_current_criteria(self) -> ScreeningCriteria:
         """Get current screening criteria."""
         return self.screening_criteria
@@ -53,23 +72,27 @@ class MarketScreener:
         Returns:
             List of screening results with event context, sorted by score (highest first)
         """
+        self._refresh_derived_criteria()
+        # One timestamp for the whole run instead of a clock read per market
+        screened_at = utc_now()
         all_results = []
         
         for event in events:
             # Screen all markets within this event
-            event_results = self._screen_markets_in_event(event)
+            event_results = self._screen_markets_in_event(event, screened_at)
             all_results.extend(event_results)
         
         # Sort by score (highest first)
-        all_results.sort(key=lambda x: x.score, reverse=True)
+        all_results.sort(key=attrgetter('score'), reverse=True)
         return all_results
     
-    def _screen_markets_in_event(self, event: Event) -> List[ScreeningResult]:
+    def _screen_markets_in_event(self, event: Event, screened_at: datetime) -> List[ScreeningResult]:
         """
         Screen all markets within a single event.
         
         Args:
             event: Event containing markets to screen
+            screened_at: Timestamp shared by all results in this screening run
             
         Returns:
             List of screening results for markets in this event
@@ -78,10 +101,10 @@ class MarketScreener:
         
         for market in event.markets:
             try:
-                result = self._screen_single_market(market, event)
+                result = self._screen_single_market(market, event, screened_at)
                 results.append(result)
             except Exception as e:
-                logger.warning(f"Failed to screen market {market.ticker} in event {event.event_ticker}: {e}")
+                logger.warning("Failed to screen market %s in event %s: %s", market.ticker, event.event_ticker, e)
                 continue
         
         return results
@@ -96,11 +119,12 @@ class MarketScreener:
         Returns:
             Dictionary with market statistics
         """
-        total_markets = sum(len(event.markets) for event in events)
-        active_markets = sum(
-            len([m for m in event.markets if m.status == 'active']) 
-            for event in events
-        )
+        # Count totals and active markets in a single pass without temporary lists
+        total_markets = 0
+        active_markets = 0
+        for event in events:
+            total_markets += len(event.markets)
+            active_markets += sum(1 for m in event.markets if m.status == 'active')
         
         return {
             'total_markets': total_markets,
@@ -108,17 +132,19 @@ class MarketScreener:
             'total_events': len(events)
         }
     
-    def _screen_single_market(self, market: Market, event: Event = None) -> ScreeningResult:
+    def _screen_single_market(self, market: Market, event: Event, screened_at: datetime) -> ScreeningResult:
         """
         Screen a single market against the screening criteria.
         
         Args:
             market: Market to screen
-            event: Associated event (optional)
+            event: Associated event
+            screened_at: Timestamp shared by all results in this screening run
             
         Returns:
             Screening result with pass/fail flag
         """
+        criteria = self.screening_criteria
         reasons = []
         passes_filters = True
         
@@ -127,57 +153,47 @@ class MarketScreener:
             passes_filters = False
         
         # Check percentage spread (if criteria is set)
-        if self.screening_criteria.max_spread_percentage is not None:
+        if criteria.max_spread_percentage is not None:
             try:
-                if hasattr(market, 'spread_percentage'):
-                    spread_pct = market.spread_percentage
-                    if spread_pct is not None:
-                        if spread_pct <= self.screening_criteria.max_spread_percentage:
-                            reasons.append(f"Spread percentage within range: {spread_pct:.1%} <= {self.screening_criteria.max_spread_percentage:.1%}")
-                        else:
-                            reasons.append(f"Spread percentage too high: {spread_pct:.1%} > {self.screening_criteria.max_spread_percentage:.1%}")
-                            passes_filters = False
+                spread_pct = market.spread_percentage
+                if spread_pct is not None:
+                    if spread_pct <= criteria.max_spread_percentage:
+                        reasons.append(f"Spread percentage within range: {spread_pct:.1%} <= {criteria.max_spread_percentage:.1%}")
                     else:
-                        reasons.append("Spread percentage calculated as None")
+                        reasons.append(f"Spread percentage too high: {spread_pct:.1%} > {criteria.max_spread_percentage:.1%}")
                         passes_filters = False
                 else:
-                    logger.warning(f"Market {market.ticker} missing spread_percentage property. Available attributes: {[attr for attr in dir(market) if not attr.startswith('_')]}")
-                    reasons.append("Market object missing spread_percentage property")
+                    reasons.append("Spread percentage calculated as None")
                     passes_filters = False
             except Exception as e:
-                logger.error(f"Error calculating spread percentage for market {market.ticker}: {e}")
+                logger.error("Error calculating spread percentage for market %s: %s", market.ticker, e)
                 reasons.append(f"Error calculating spread percentage: {e}")
                 passes_filters = False
         
         # Check spread in cents (if criteria is set)
-        if (self.screening_criteria.min_spread_cents is not None or 
-            self.screening_criteria.max_spread_cents is not None):
+        if (criteria.min_spread_cents is not None or 
+            criteria.max_spread_cents is not None):
             try:
-                if hasattr(market, 'spread_cents'):
-                    spread_cents = market.spread_cents
-                    if spread_cents is not None:
-                        min_cents = self.screening_criteria.min_spread_cents or 0
-                        max_cents = self.screening_criteria.max_spread_cents or float('inf')
-                        
-                        if min_cents <= spread_cents <= max_cents:
-                            reasons.append(f"Spread cents within range: {spread_cents} cents (min: {min_cents}, max: {max_cents})")
-                        else:
-                            reasons.append(f"Spread cents outside range: {spread_cents} cents (min: {min_cents}, max: {max_cents})")
-                            passes_filters = False
+                spread_cents = market.spread_cents
+                if spread_cents is not None:
+                    min_cents = self._min_spread_cents
+                    max_cents = self._max_spread_cents
+                    
+                    if min_cents <= spread_cents <= max_cents:
+                        reasons.append(f"Spread cents within range: {spread_cents} cents (min: {min_cents}, max: {max_cents})")
                     else:
-                        reasons.append("Spread cents calculated as None")
+                        reasons.append(f"Spread cents outside range: {spread_cents} cents (min: {min_cents}, max: {max_cents})")
                         passes_filters = False
                 else:
-                    logger.warning(f"Market {market.ticker} missing spread_cents property")
-                    reasons.append("Market object missing spread_cents property")
+                    reasons.append("Spread cents calculated as None")
                     passes_filters = False
             except Exception as e:
-                logger.error(f"Error calculating spread cents for market {market.ticker}: {e}")
+                logger.error("Error calculating spread cents for market %s: %s", market.ticker, e)
                 reasons.append(f"Error calculating spread cents: {e}")
                 passes_filters = False
         
         # If no criteria are set, market passes by default
-        if self._no_criteria_set():
+        if self._criteria_empty:
             reasons.append("No screening criteria set - market passes by default")
             passes_filters = True
         
@@ -186,57 +202,63 @@ class MarketScreener:
             event=event,
             score=1.0 if passes_filters else 0.0,
             reasons=reasons,
-            timestamp=utc_now()
+            timestamp=screened_at
         )
     
     def _check_basic_requirements(self, market: Market, reasons: List[str]) -> bool:
         """Check if market meets basic requirements."""
+        criteria = self.screening_criteria
+        
+        # Checks are ordered cheapest first; days_to_close reads the clock so it runs last
         # Market must be active (open)
-        if market.status not in ["active"]:
+        if market.status != "active":
             reasons.append(f"Market is not active (status: {market.status})")
             return False
         
         # Must have minimum volume (check both total volume and 24h volume)
-        if self.screening_criteria.min_volume is not None:
-            if market.volume < self.screening_criteria.min_volume:
-                reasons.append(f"Total volume too low: {market.volume} < {self.screening_criteria.min_volume}")
+        if criteria.min_volume is not None:
+            if market.volume < criteria.min_volume:
+                reasons.append(f"Total volume too low: {market.volume} < {criteria.min_volume}")
                 return False
         
-        if self.screening_criteria.min_volume_24h is not None:
-            if market.volume_24h < self.screening_criteria.min_volume_24h:
-                reasons.append(f"24h volume too low: {market.volume_24h} < {self.screening_criteria.min_volume_24h}")
+        if criteria.min_volume_24h is not None:
+            if market.volume_24h < criteria.min_volume_24h:
+                reasons.append(f"24h volume too low: {market.volume_24h} < {criteria.min_volume_24h}")
                 return False
         
         # Must have minimum open interest
-        if self.screening_criteria.min_open_interest is not None:
-            if market.open_interest < self.screening_criteria.min_open_interest:
-                reasons.append(f"Open interest too low: {market.open_interest} < {self.screening_criteria.min_open_interest}")
+        if criteria.min_open_interest is not None:
+            if market.open_interest < criteria.min_open_interest:
+                reasons.append(f"Open interest too low: {market.open_interest} < {criteria.min_open_interest}")
                 return False
         
         # Must have minimum liquidity (volume + open interest)
-        if self.screening_criteria.min_liquidity_dollars is not None:
-            if market.liquidity_dollars < self.screening_criteria.min_liquidity_dollars:
-                reasons.append(f"Liquidity too low: {market.liquidity_dollars} < {self.screening_criteria.min_liquidity_dollars}")
+        if criteria.min_liquidity_dollars is not None:
+            if market.liquidity_dollars < criteria.min_liquidity_dollars:
+                reasons.append(f"Liquidity too low: {market.liquidity_dollars} < {criteria.min_liquidity_dollars}")
                 return False
         
         # Must be within time limit
-        if (self.screening_criteria.max_time_to_close_days is not None and 
-            market.days_to_close > self.screening_criteria.max_time_to_close_days):
-            reasons.append(f"Too far from close: {market.days_to_close} days")
-            return False
+        if criteria.max_time_to_close_days is not None:
+            days_to_close = market.days_to_close
+            if days_to_close > criteria.max_time_to_close_days:
+                reasons.append(f"Too far from close: {days_to_close} days")
+                return False
         
         return True
     
     def _no_criteria_set(self) -> bool:
         """Check if any screening criteria are set."""
-        return all([
-            self.screening_criteria.min_volume is None,
-            self.screening_criteria.min_volume_24h is None,
-            self.screening_criteria.max_spread_percentage is None,
-            self.screening_criteria.max_spread_cents is None,
-            self.screening_criteria.min_spread_cents is None,
-            self.screening_criteria.min_liquidity_dollars is None,
-            self.screening_criteria.max_time_to_close_days is None,
-            self.screening_criteria.min_open_interest is None,
-            self.screening_criteria.categories is None
-        ])
+        criteria = self.screening_criteria
+        # Short-circuits on the first criterion that is set instead of building a list
+        return (
+            criteria.min_volume is None and
+            criteria.min_volume_24h is None and
+            criteria.max_spread_percentage is None and
+            criteria.max_spread_cents is None and
+            criteria.min_spread_cents is None and
+            criteria.min_liquidity_dollars is None and
+            criteria.max_time_to_close_days is None and
+            criteria.min_open_interest is None and
+            criteria.categories is None
+        )
@@ -0,0 +1,33 @@
+"""
+Unit tests for executing generated screening code (no Gemini or network access).
+"""
+from unittest.mock import MagicMock
+
+from kalshi.models import ScreeningResult
+from screening import GeminiScreener
+
+SCREENING_CODE = '''
+def screen_markets(market, event):
+    return market.ticker == "MKT-A", ["checked " + market.ticker]
+'''
+
+
+def test_execute_screening_function_from_results_reuses_market_event_pairs():
+    """Re-screening stored results must not require a separate events list."""
+    config = MagicMock(GEMINI_API_KEY=None)
+    screener = GeminiScreener(config)
+
+    event = MagicMock(event_ticker="EVT")
+    market_a = MagicMock(ticker="MKT-A")
+    market_b = MagicMock(ticker="MKT-B")
+    previous = [
+        ScreeningResult(market=market_a, event=event),
+        ScreeningResult(market=market_b, event=event),
+    ]
+
+    results = screener.execute_screening_function_from_results(SCREENING_CODE, previous)
+
+    assert [r.market.ticker for r in results] == ["MKT-A", "MKT-B"]
+    assert [r.score for r in results] == [1.0, 0.0]
+    assert all(r.event is event for r in results)
+    assert results[0].reasons == ["checked MKT-A"]
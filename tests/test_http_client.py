@@ -0,0 +1,71 @@
+"""
+Unit tests for the KalshiHTTPClient in-memory cache (no network access).
+"""
+from unittest.mock import MagicMock, patch
+
+from kalshi.constants import DEFAULT_CACHE_TTL
+from kalshi.http_client import KalshiHTTPClient
+
+
+def make_client() -> KalshiHTTPClient:
+    """Create a client without credentials; the cache needs none."""
+    return KalshiHTTPClient(MagicMock(KALSHI_PRIVATE_KEY_PATH=None))
+
+
+def test_invalidate_positions_cache_clears_bare_key():
+    """Entries cached without an identifier are removed by invalidation."""
+    client = make_client()
+    client.set_cache('positions', {'market_positions': []})
+    client.set_cache('enriched_positions', ['enriched'], 'abc')
+
+    client.invalidate_positions_cache()
+
+    assert client.get_cached('positions') is None
+    assert client.get_cached('enriched_positions', 'abc') is None
+
+
+def test_clear_cache_leaves_other_types():
+    """Clearing one cache type does not touch types sharing a name prefix."""
+    client = make_client()
+    client.set_cache('market', 'm', 'MKT-A')
+    client.set_cache('markets', 'all')
+
+    client.clear_cache('market')
+
+    assert client.get_cached('market', 'MKT-A') is None
+    assert client.get_cached('markets') == 'all'
+
+
+def test_cache_entry_expires_after_its_type_ttl():
+    """Entries are valid until their per-type TTL elapses, then expire."""
+    client = make_client()
+    ttl = client._cache_ttl['balance']
+
+    with patch('kalshi.http_client.time.time', return_value=1000.0):
+        client.set_cache('balance', 42.0)
+    with patch('kalshi.http_client.time.time', return_value=1000.0 + ttl - 1):
+        assert client.get_cached('balance') == 42.0
+        assert client.get_cache_stats()['expired_entries'] == 0
+    with patch('kalshi.http_client.time.time', return_value=1000.0 + ttl):
+        assert client.get_cached('balance') is None
+        assert client.get_cache_stats()['expired_entries'] == 1
+
+
+def test_cache_ttl_is_per_type():
+    """Types with different TTLs expire independently; unknown types use the default."""
+    client = make_client()
+    balance_ttl = client._cache_ttl['balance']
+    market_ttl = client._cache_ttl['market']
+    assert balance_ttl < market_ttl
+
+    with patch('kalshi.http_client.time.time', return_value=0.0):
+        client.set_cache('balance', 1.0)
+        client.set_cache('market', 'm', 'MKT-A')
+        client.set_cache('unknown_type', 'x')
+    with patch('kalshi.http_client.time.time', return_value=float(balance_ttl)):
+        assert client.get_cached('balance') is None
+        assert client.get_cached('market', 'MKT-A') == 'm'
+    with patch('kalshi.http_client.time.time', return_value=DEFAULT_CACHE_TTL - 1.0):
+        assert client.get_cached('unknown_type') == 'x'
+    with patch('kalshi.http_client.time.time', return_value=float(DEFAULT_CACHE_TTL)):
+        assert client.get_cached('unknown_type') is None
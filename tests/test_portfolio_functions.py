@@ -0,0 +1,45 @@
+"""
+Unit tests for portfolio P&L helpers (no network access).
+"""
+from unittest.mock import MagicMock, patch
+
+from kalshi import portfolio_functions
+from kalshi.http_client import KalshiHTTPClient
+
+
+def make_position(ticker: str, size: int) -> dict:
+    """Build an active position payload as returned by the positions endpoint."""
+    return {
+        'ticker': ticker,
+        'position': size,
+        'market_exposure_dollars': '5.00',
+        'realized_pnl_dollars': '0.00',
+        'fees_paid_dollars': '0.10',
+    }
+
+
+def test_unrealized_pnl_prefetches_markets_and_reads_them_from_cache():
+    """Active tickers are prefetched once; per-position lookups are cache hits."""
+    client = KalshiHTTPClient(MagicMock(KALSHI_PRIVATE_KEY_PATH=None))
+    client.session = MagicMock()
+    active_positions = [make_position('MKT-A', 10), make_position('MKT-B', -10)]
+    positions_data = {
+        'active_positions': active_positions,
+        'active_positions_by_ticker': {pos['ticker']: pos for pos in active_positions},
+    }
+
+    def prefetch(client, tickers):
+        markets = {ticker: MagicMock(ticker=ticker, last_price_dollars=0.6) for ticker in tickers}
+        for ticker, market in markets.items():
+            client.set_cache('market', market, ticker)
+        return markets
+
+    with patch.object(portfolio_functions, 'get_all_positions', return_value=positions_data), \
+         patch.object(portfolio_functions, 'get_markets_by_tickers', side_effect=prefetch) as prefetch_mock:
+        result = portfolio_functions.get_all_unrealized_pnl(client)
+
+    prefetch_mock.assert_called_once_with(client, ['MKT-A', 'MKT-B'])
+    client.session.get.assert_not_called()
+    assert result['position_count'] == 2
+    assert result['positions']['MKT-A']['current_price'] == 0.6
+    assert round(result['positions']['MKT-B']['current_price'], 2) == 0.4